@@ -15,11 +15,6 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
-# Import models to ensure they are registered with Base
-# This is crucial for autogenerate to work properly
-from app.models.task import Task, TaskLog
-from app.core.database import Base
-
 # Alembic Config object
 config = context.config
 
@@ -27,8 +22,17 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Set target metadata for migrations
-target_metadata = Base.metadata
+# Set target metadata for migrations. Importing the models registers them
+# with Base, which autogenerate needs; offline (--sql) runs only replay
+# handwritten operations, so they skip the application import entirely
+# (app.core.database builds the engine at import time).
+if context.is_offline_mode():
+    target_metadata = None
+else:
+    from app.models.task import Task, TaskLog  # noqa: F401
+    from app.core.database import Base
+
+    target_metadata = Base.metadata
 
 # Override sqlalchemy.url from environment variable if available
 database_url = os.getenv("DATABASE_URL")
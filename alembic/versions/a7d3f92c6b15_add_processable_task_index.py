@@ -0,0 +1,35 @@
+"""Add a partial index for the processable-task poll
+
+Revision ID: a7d3f92c6b15
+Revises: e4c2b7f1a358
+Create Date: 2026-08-30 19:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3f92c6b15'
+down_revision = 'e4c2b7f1a358'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # get_tasks_for_processing filters status IN ('pending','failed') and
+    # orders by (priority, created_at); this partial index serves that
+    # poll with an ordered scan over just the processable subset
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_processable "
+            "ON tasks (priority, created_at) "
+            "WHERE status IN ('pending', 'failed')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_processable")
@@ -0,0 +1,58 @@
+"""Add active-task partial index and log composite index
+
+Revision ID: b82d4f061c93
+Revises: f3a1c9e25b74
+Create Date: 2026-08-30 18:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b82d4f061c93'
+down_revision = 'f3a1c9e25b74'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    with op.get_context().autocommit_block():
+        # Covers the background processor's status+priority scan over
+        # non-terminal rows; terminal statuses dominate the table over time
+        # and are excluded so the index stays small
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_active "
+            "ON tasks (status, priority, created_at DESC) "
+            "WHERE status IN ('pending', 'in_progress')"
+        )
+        # Serves the FK lookup and the per-task recency ordering of logs
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_logs_task_created "
+            "ON task_logs (task_id, created_at DESC)"
+        )
+        # Single-column indexes now redundant: status and priority lead the
+        # composite indexes, task_id leads idx_task_logs_task_created
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_priority")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_task_logs_task_id")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_logs_task_id "
+            "ON task_logs (task_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_priority "
+            "ON tasks (priority)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_status "
+            "ON tasks (status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_logs_task_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_active")
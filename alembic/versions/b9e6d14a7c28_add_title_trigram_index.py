@@ -0,0 +1,36 @@
+"""Add a trigram index for title substring search
+
+Revision ID: b9e6d14a7c28
+Revises: a7d3f92c6b15
+Create Date: 2026-08-30 19:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e6d14a7c28'
+down_revision = 'a7d3f92c6b15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # The title filter is ILIKE '%...%': the leading wildcard defeats
+    # btree indexes, but a pg_trgm GIN index lets the planner serve
+    # substring matches with an index scan while keeping the query and
+    # its semantics unchanged
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_title_trgm "
+            "ON tasks USING gin (title gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_title_trgm")
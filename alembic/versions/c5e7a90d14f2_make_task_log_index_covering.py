@@ -0,0 +1,48 @@
+"""Make the task_logs recency index covering
+
+Revision ID: c5e7a90d14f2
+Revises: b82d4f061c93
+Create Date: 2026-08-30 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e7a90d14f2'
+down_revision = 'b82d4f061c93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Rebuild with the TaskLogResponse columns in the INCLUDE list so the
+    # per-task log window is an index-only scan; the new index is created
+    # before the old one is dropped to avoid a coverage gap
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_logs_task_created_new "
+            "ON task_logs (task_id, created_at DESC) "
+            "INCLUDE (id, status, message)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_logs_task_created")
+        op.execute(
+            "ALTER INDEX idx_task_logs_task_created_new "
+            "RENAME TO idx_task_logs_task_created"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_logs_task_created_new "
+            "ON task_logs (task_id, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_logs_task_created")
+        op.execute(
+            "ALTER INDEX idx_task_logs_task_created_new "
+            "RENAME TO idx_task_logs_task_created"
+        )
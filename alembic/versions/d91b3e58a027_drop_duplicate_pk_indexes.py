@@ -0,0 +1,38 @@
+"""Drop duplicate primary-key indexes
+
+Revision ID: d91b3e58a027
+Revises: c5e7a90d14f2
+Create Date: 2026-08-30 19:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91b3e58a027'
+down_revision = 'c5e7a90d14f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # index=True on the primary keys built a second btree identical to the
+    # PK's own unique index; dropping it removes one index maintenance per
+    # insert and delete on both tables
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_task_logs_id")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_id ON tasks (id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_logs_id "
+            "ON task_logs (id)"
+        )
@@ -0,0 +1,47 @@
+"""Use a native enum for status and smallint for priority
+
+Revision ID: e4c2b7f1a358
+Revises: d91b3e58a027
+Create Date: 2026-08-30 19:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4c2b7f1a358'
+down_revision = 'd91b3e58a027'
+branch_labels = None
+depends_on = None
+
+_STATUS_VALUES = ("pending", "in_progress", "completed", "failed", "cancelled")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    statuses = ", ".join(f"'{value}'" for value in _STATUS_VALUES)
+    op.execute(f"CREATE TYPE task_status AS ENUM ({statuses})")
+    op.execute(
+        "ALTER TABLE tasks ALTER COLUMN status "
+        "TYPE task_status USING status::task_status"
+    )
+    op.execute(
+        "ALTER TABLE task_logs ALTER COLUMN status "
+        "TYPE task_status USING status::task_status"
+    )
+    op.execute("ALTER TABLE tasks ALTER COLUMN priority TYPE smallint")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("ALTER TABLE tasks ALTER COLUMN priority TYPE integer")
+    op.execute(
+        "ALTER TABLE task_logs ALTER COLUMN status "
+        "TYPE varchar(50) USING status::text"
+    )
+    op.execute(
+        "ALTER TABLE tasks ALTER COLUMN status "
+        "TYPE varchar(50) USING status::text"
+    )
+    op.execute("DROP TYPE task_status")
@@ -0,0 +1,44 @@
+"""Add composite indexes for task list queries
+
+Revision ID: f3a1c9e25b74
+Revises:
+Create Date: 2026-08-30 18:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a1c9e25b74'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, so these
+    # are raw statements in an autocommit block rather than op.create_index.
+    # Concurrent builds avoid taking a write lock on a live tasks table.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_status_created "
+            "ON tasks (status, created_at DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_priority_created "
+            "ON tasks (priority, created_at DESC, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_pending_created "
+            "ON tasks (created_at DESC) WHERE status = 'pending'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_pending_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_priority_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_status_created")
@@ -5,10 +5,12 @@ This module defines all REST API endpoints for task management operations,
 including CRUD operations, filtering, pagination, and background processing.
 """
 
-import math
-from typing import Dict
+import logging
+from typing import Dict, Iterator, List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -21,11 +23,62 @@ from app.schemas.task import (
     TaskSummaryResponse,
     TaskUpdate,
 )
-from app.services.background_tasks import process_task, get_processing_status
-from app.services.task_service import TaskService
+from app.services.background_tasks import process_task
+from app.services.task_service import (
+    TaskService,
+    decode_task_cursor,
+    encode_task_cursor,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Reusable filter instances for the common no-filter first-page listing.
+# Query() has already range-checked page/per_page, so re-validating them
+# through pydantic on every request is redundant; the cached instances are
+# only ever read by the service layer. Restricted to page 1 so the key
+# space is bounded (per_page is capped at 100) — keying on the
+# client-controlled page number would let a deep crawl grow the dict
+# without limit.
+_DEFAULT_FILTERS_CACHE: Dict[tuple, TaskFilterParams] = {}
+
+# Pages at least this large are serialized incrementally instead of being
+# materialized as one JSON body in memory
+_STREAM_PAGE_THRESHOLD = 50
+
+
+def _stream_task_list(
+    tasks: List,
+    metadata: Dict,
+) -> Iterator[bytes]:
+    """
+    Yield a TaskListResponse-shaped JSON body row by row.
+
+    The ORM rows for the page are already materialized by the time this
+    runs; what streaming avoids is buffering a parallel list of summary
+    models plus the whole encoded body. Each row is converted and
+    serialized as it is sent, so beyond the rows themselves only one
+    encoded row is held at a time and the first bytes reach the client
+    before the tail of the page is encoded.
+
+    Args:
+        tasks: ORM task rows for the page
+        metadata: Pagination metadata fields of the response
+
+    Yields:
+        Chunks of the JSON response body
+    """
+    yield b'{"items":['
+    for index, task in enumerate(tasks):
+        if index:
+            yield b","
+        yield orjson.dumps(
+            TaskSummaryResponse.from_orm_trusted(task).model_dump()
+        )
+    # Splice the metadata object in after the items array
+    yield b"]," + orjson.dumps(metadata)[1:]
+
 
 async def get_task_service(db: AsyncSession = Depends(get_db)) -> TaskService:
     """
@@ -66,7 +119,7 @@ async def create_task(
     """
     try:
         task = await task_service.create_task(task_data)
-        return TaskResponse.model_validate(task)
+        return TaskResponse.from_orm_trusted(task)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -89,57 +142,111 @@ async def list_tasks(
     task_status: str = Query(None, description="Filter by task status", alias="status"),
     priority: int = Query(None, description="Filter by task priority"),
     title: str = Query(None, description="Filter by title (partial match)"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored in cursor mode)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str = Query(
+        None,
+        description="Opaque keyset cursor from a previous response's next_cursor; "
+                    "preferred over page for deep pagination"
+    ),
+    include_total: bool = Query(
+        False,
+        description="Compute the total result count (costs an extra scan; "
+                    "ignored in cursor mode)"
+    ),
     task_service: TaskService = Depends(get_task_service)
 ) -> TaskListResponse:
     """
     List tasks with filtering and pagination.
-    
+
     Args:
         task_status: Optional status filter
         priority: Optional priority filter
         title: Optional title filter (partial match)
-        page: Page number (1-based)
+        page: Page number (1-based, ignored when a cursor is provided)
         per_page: Number of items per page
+        cursor: Optional keyset cursor for constant-time deep pagination
+        include_total: Whether to compute total/pages metadata
         task_service: Task service instance
-        
+
     Returns:
         Paginated list of tasks
-        
+
     Raises:
         HTTPException: If filtering parameters are invalid
     """
     try:
-        # Validate and create filter parameters
-        filters = TaskFilterParams(
-            status=task_status,
-            priority=priority,
-            title=title,
-            page=page,
-            per_page=per_page
-        )
-        
-        tasks, total_count = await task_service.get_tasks(filters)
-        
-        # Calculate pagination metadata
-        total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
-        has_next = page < total_pages
-        has_prev = page > 1
-        
-        # Convert to response format
-        task_summaries = [TaskSummaryResponse.model_validate(task) for task in tasks]
-        
-        return TaskListResponse(
-            items=task_summaries,
+        # Validate and create filter parameters; skip pydantic entirely
+        # when no filters were supplied
+        if (
+            task_status is None and priority is None and title is None
+            and cursor is None and page == 1
+        ):
+            filters = _DEFAULT_FILTERS_CACHE.setdefault(
+                (per_page, include_total),
+                TaskFilterParams(per_page=per_page, include_total=include_total)
+            )
+        else:
+            filters = TaskFilterParams(
+                status=task_status,
+                priority=priority,
+                title=title,
+                page=page,
+                per_page=per_page,
+                cursor=cursor,
+                include_total=include_total
+            )
+
+        decoded_cursor = decode_task_cursor(filters.cursor) if filters.cursor else None
+        tasks, total_count = await task_service.get_tasks(filters, cursor=decoded_cursor)
+
+        if total_count is not None:
+            # Totals requested: derive metadata from the count using pure
+            # integer arithmetic (ceiling division without math.ceil)
+            total_pages = (total_count + per_page - 1) // per_page or 1
+            has_next = page * per_page < total_count
+            has_prev = page > 1
+        else:
+            # No count was run: the service fetched one extra row to signal
+            # has_next
+            has_next = len(tasks) > per_page
+            tasks = tasks[:per_page]
+            total_pages = None
+            has_prev = decoded_cursor is None and page > 1
+
+        next_cursor = encode_task_cursor(tasks[-1]) if has_next and tasks else None
+
+        if per_page >= _STREAM_PAGE_THRESHOLD:
+            # Large pages: stream the body instead of buffering it; the
+            # generator builds each summary as it serializes
+            return StreamingResponse(
+                _stream_task_list(tasks, {
+                    "total": total_count,
+                    "page": page,
+                    "per_page": per_page,
+                    "pages": total_pages,
+                    "has_next": has_next,
+                    "has_prev": has_prev,
+                    "next_cursor": next_cursor,
+                }),
+                media_type="application/json"
+            )
+
+        # Rows came straight from the database, so take the trusted
+        # construction path instead of re-validating each one; every
+        # envelope field is likewise already validated or trivially
+        # derived, so skip its validation pass as well
+        return TaskListResponse.model_construct(
+            items=[TaskSummaryResponse.from_orm_trusted(task) for task in tasks],
             total=total_count,
             page=page,
             per_page=per_page,
             pages=total_pages,
             has_next=has_next,
-            has_prev=has_prev
+            has_prev=has_prev,
+            next_cursor=next_cursor
         )
-        
+
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -182,7 +289,7 @@ async def get_task(
             detail=f"Task with ID {task_id} not found"
         )
     
-    return TaskResponse.model_validate(task)
+    return TaskResponse.from_orm_trusted(task)
 
 
 @router.put(
@@ -218,7 +325,7 @@ async def update_task(
                 detail=f"Task with ID {task_id} not found"
             )
         
-        return TaskResponse.model_validate(task)
+        return TaskResponse.from_orm_trusted(task)
         
     except ValueError as e:
         raise HTTPException(
@@ -229,10 +336,12 @@ async def update_task(
         # Re-raise HTTP exceptions (like 404)
         raise
     except Exception as e:
-        # Log the actual error for debugging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Unexpected error updating task {task_id}: {type(e).__name__}: {e}", exc_info=True)
+        # Lazy %-formatting: the message is only built if ERROR is enabled
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Unexpected error updating task %s: %s: %s",
+                task_id, type(e).__name__, e, exc_info=True
+            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update task: {str(e)}"
@@ -275,10 +384,12 @@ async def delete_task(
         # Re-raise HTTP exceptions (like 404)
         raise
     except Exception as e:
-        # Log the actual error for debugging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Unexpected error deleting task {task_id}: {type(e).__name__}: {e}", exc_info=True)
+        # Lazy %-formatting: the message is only built if ERROR is enabled
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Unexpected error deleting task %s: %s: %s",
+                task_id, type(e).__name__, e, exc_info=True
+            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete task: {str(e)}"
@@ -394,6 +505,10 @@ async def get_background_processing_status() -> Dict:
         HTTPException: If status retrieval fails
     """
     try:
+        # Imported lazily: workers that never serve this route skip loading
+        # the background-processing machinery at fork time
+        from app.services.background_tasks import get_processing_status
+
         status_info = await get_processing_status()
         return status_info
     except Exception as e:
@@ -0,0 +1,81 @@
+"""
+In-process caching utilities.
+
+This module provides a small async-aware TTL cache used to memoize
+read-heavy aggregate computations (such as task statistics) so that
+bursts of identical requests do not repeatedly hit the database.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """
+    Small in-process TTL cache for async computations.
+
+    Concurrent callers of the same key are coalesced behind a per-key lock,
+    so a burst of identical requests results in a single computation instead
+    of a dogpile of redundant ones. Entries expire after the configured TTL
+    and can be invalidated explicitly by writers.
+
+    Note: this cache is per-process. Deployments running multiple workers
+    will compute at most one value per worker per TTL window, which is
+    usually acceptable for short TTLs; a shared backend (e.g. Redis) would
+    be needed for cross-worker coalescing.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time-to-live for cached entries, in seconds
+        """
+        self._ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for a key, computing it if needed.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument coroutine function producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check after acquiring the lock: another caller may have
+            # computed the value while we were waiting
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = await compute()
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Invalidate a cached entry, or all entries.
+
+        Args:
+            key: Key to invalidate; all entries are dropped when None
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -5,9 +5,12 @@ This module defines the configuration classes for the Task Management API,
 including database settings, Redis configuration, and other environment-specific variables.
 """
 
+import os
+from functools import lru_cache
 from typing import Optional
-from pydantic import ConfigDict, Field, field_validator
-from pydantic_settings import BaseSettings
+
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -26,10 +29,19 @@ class Settings(BaseSettings):
     # Environment
     ENV: str = Field(default="development", description="Environment (development, production, testing)")
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
+    UVICORN_WORKERS: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        description="Number of uvicorn worker processes"
+    )
     
     # Database Configuration
     DATABASE_URL: str = Field(description="PostgreSQL database URL")
     DATABASE_ECHO: bool = Field(default=False, description="Enable SQLAlchemy query logging")
+    DB_POOL_SIZE: int = Field(default=20, description="Number of persistent database connections")
+    DB_MAX_OVERFLOW: int = Field(default=40, description="Extra connections allowed beyond the pool size under load")
+    DB_POOL_RECYCLE: int = Field(default=1800, description="Seconds after which pooled connections are recycled")
+    DB_POOL_PRE_PING: bool = Field(default=True, description="Validate pooled connections before use")
+    DB_POOL_TIMEOUT: int = Field(default=30, description="Seconds to wait for a pooled connection before erroring")
     
     # Redis Configuration
     REDIS_URL: str = Field(description="Redis connection URL")
@@ -86,7 +98,12 @@ class Settings(BaseSettings):
             return v
         raise ValueError("CORS origins must be a list or comma-separated string")
     
-    model_config = ConfigDict(env_file=".env", case_sensitive=True)
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+    )
 
 
 class TestSettings(Settings):
@@ -102,17 +119,20 @@ class TestSettings(Settings):
     LOG_LEVEL: str = "DEBUG"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings instance.
     
     Returns the appropriate settings class based on the environment.
-    This function can be easily mocked in tests.
+    Building a Settings instance re-reads the .env file and runs every
+    validator, so the result is cached and each process gets exactly one
+    canonical instance. This function can be easily mocked in tests
+    (clear the cache via get_settings.cache_clear() when doing so).
     
     Returns:
         Settings instance for the current environment
     """
-    import os
     env = os.getenv("ENV", "development")
     
     if env == "testing":
@@ -5,21 +5,45 @@ This module provides database connectivity, session management, and
 base database utilities for the Task Management API.
 """
 
+import asyncio
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-# Create async engine with connection pooling
+# Create async engine with connection pooling. Pool sizing is exposed as
+# settings so ops can tune it without a code change; an aggressive recycle
+# interval would force constant reconnects (TLS handshake + backend fork)
+# under steady load, so connections are kept for much longer and validated
+# via pre-ping instead.
+if settings.ENV == "testing":
+    _engine_kwargs = {"poolclass": NullPool}
+else:
+    _engine_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+# When the app sits behind PgBouncer in transaction-pooling mode, asyncpg's
+# prepared-statement cache breaks (statements outlive the server connection
+# they were prepared on); disable it there with
+# connect_args={"statement_cache_size": 0}.
+
 engine = create_async_engine(
     str(settings.DATABASE_URL),
     echo=settings.DATABASE_ECHO,
     future=True,
-    poolclass=NullPool if settings.ENV == "testing" else None,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    **_engine_kwargs,
 )
 
 # Create async session factory
@@ -29,6 +53,14 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Scoped registry keyed on the current asyncio task: everything running
+# inside one request task shares one session instead of minting a new one
+# per acquisition, which is the pattern that exhausts the pool under load.
+AsyncScopedSession = async_scoped_session(
+    AsyncSessionLocal,
+    scopefunc=asyncio.current_task,
+)
+
 # Create declarative base for SQLAlchemy models
 Base = declarative_base()
 
@@ -51,14 +83,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             pass
         ```
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    # The scoped registry hands back the same session for any code running
+    # in this request's task; remove() closes it and clears the registry
+    # entry once the request is done
+    session = AsyncScopedSession()
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await AsyncScopedSession.remove()
 
 
 async def create_db_and_tables() -> None:
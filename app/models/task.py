@@ -12,12 +12,17 @@ from typing import List, Optional
 from sqlalchemy import (
     Column,
     DateTime,
+    Enum as SqlEnum,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     func,
+    text,
 )
+from sqlalchemy.dialects.sqlite import DATETIME as SqliteDateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -48,6 +53,34 @@ class TaskPriority(int, Enum):
     CRITICAL = 0
 
 
+# Status strings hoisted out of the predicate methods: one module-level
+# constant load instead of the enum -> member -> .value chain per call
+_STATUS_PENDING = TaskStatus.PENDING.value
+_STATUS_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+_STATUS_COMPLETED = TaskStatus.COMPLETED.value
+_STATUS_FAILED = TaskStatus.FAILED.value
+_CAN_BE_PROCESSED = frozenset({_STATUS_PENDING, _STATUS_FAILED})
+
+# Shared column type for status: a native 1-byte enum on PostgreSQL
+# (smaller rows and indexes, enum-label comparisons), a plain VARCHAR on
+# SQLite. String values keep the Mapped[str] typing and every existing
+# .value comparison intact.
+_task_status_enum = SqlEnum(
+    *(status.value for status in TaskStatus),
+    name="task_status",
+    native_enum=True,
+)
+
+# Timestamp type shared by both tables. On SQLite, CURRENT_TIMESTAMP
+# stores second precision while the default bind format always renders
+# microseconds, so equality comparisons against stored values (keyset
+# cursors) silently never match; truncating binds aligns the two. The
+# PostgreSQL side is plain timestamptz.
+_timestamp_type = DateTime(timezone=True).with_variant(
+    SqliteDateTime(truncate_microseconds=True), "sqlite"
+)
+
+
 class Task(Base):
     """
     Task model representing a task in the system.
@@ -67,41 +100,108 @@ class Task(Base):
     """
     
     __tablename__ = "tasks"
-    
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Fetch server-generated defaults (created_at, updated_at) via
+    # RETURNING on the INSERT itself, so creates need no follow-up
+    # refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Composite indexes matching the list_tasks filter + keyset sort
+    # patterns. The single-column indexes alone leave those queries with a
+    # sort-scan once the table grows; the partial index covers the frequent
+    # processable-tasks lookup without indexing the whole table.
+    __table_args__ = (
+        Index(
+            "idx_tasks_status_created",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_tasks_priority_created",
+            "priority",
+            text("created_at DESC"),
+            "id",
+        ),
+        Index(
+            "idx_tasks_pending_created",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+        Index(
+            "idx_tasks_active",
+            "status",
+            "priority",
+            text("created_at DESC"),
+            postgresql_where=text("status IN ('pending', 'in_progress')"),
+            sqlite_where=text("status IN ('pending', 'in_progress')"),
+        ),
+        # Matches get_tasks_for_processing exactly: the worker poll reads
+        # the index in (priority, created_at) order over just the
+        # processable subset, no sort and no full-table filter
+        Index(
+            "idx_tasks_processable",
+            "priority",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'failed')"),
+            sqlite_where=text("status IN ('pending', 'failed')"),
+        ),
+        # Trigram GIN index so title ILIKE '%...%' is an index scan on
+        # PostgreSQL instead of a sequential scan (a leading wildcard
+        # defeats btrees); requires the pg_trgm extension. Other backends
+        # get a plain index, which is harmless.
+        Index(
+            "idx_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
+    # The primary key is already backed by a unique index; index=True
+    # would build an identical second btree on every insert
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # status and priority are each the leading column of a composite
+    # index above, so standalone single-column indexes would be redundant
     status: Mapped[str] = mapped_column(
-        String(50), 
+        _task_status_enum,
         nullable=False, 
-        default=TaskStatus.PENDING.value,
-        index=True
+        default=TaskStatus.PENDING.value
     )
+    # Priorities fit comfortably in two bytes
     priority: Mapped[int] = mapped_column(
-        Integer, 
+        SmallInteger, 
         nullable=False, 
-        default=TaskPriority.MEDIUM.value,
-        index=True
+        default=TaskPriority.MEDIUM.value
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        _timestamp_type,
         server_default=func.now(),
         nullable=False,
         index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        _timestamp_type,
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False
     )
     
     # Relationships
+    # Lazy by default: list queries return TaskSummaryResponse and never
+    # touch logs, so only the detail path opts in via selectinload
+    # passive_deletes defers log removal to the ON DELETE CASCADE foreign
+    # key, so deleting a task neither loads the collection nor issues
+    # per-row DELETEs
     logs: Mapped[List["TaskLog"]] = relationship(
         "TaskLog",
         back_populates="task",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="select",
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
@@ -115,7 +215,7 @@ class Task(Base):
         Returns:
             True if task is in progress, False otherwise
         """
-        return self.status == TaskStatus.IN_PROGRESS.value
+        return self.status == _STATUS_IN_PROGRESS
     
     def is_completed(self) -> bool:
         """
@@ -124,7 +224,7 @@ class Task(Base):
         Returns:
             True if task is completed, False otherwise
         """
-        return self.status == TaskStatus.COMPLETED.value
+        return self.status == _STATUS_COMPLETED
     
     def is_failed(self) -> bool:
         """
@@ -133,7 +233,7 @@ class Task(Base):
         Returns:
             True if task failed, False otherwise
         """
-        return self.status == TaskStatus.FAILED.value
+        return self.status == _STATUS_FAILED
     
     def can_be_processed(self) -> bool:
         """
@@ -142,7 +242,7 @@ class Task(Base):
         Returns:
             True if task can be processed, False otherwise
         """
-        return self.status in [TaskStatus.PENDING.value, TaskStatus.FAILED.value]
+        return self.status in _CAN_BE_PROCESSED
 
 
 class TaskLog(Base):
@@ -162,18 +262,31 @@ class TaskLog(Base):
     """
     
     __tablename__ = "task_logs"
-    
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Serves both the FK lookup and the ordering by recency. On PostgreSQL
+    # the response columns ride along via INCLUDE, so log fetches are
+    # index-only scans and never touch the heap.
+    __table_args__ = (
+        Index(
+            "idx_task_logs_task_created",
+            "task_id",
+            text("created_at DESC"),
+            postgresql_include=["id", "status", "message"],
+        ),
+    )
+
+    # The primary key is already backed by a unique index; index=True
+    # would build an identical second btree on every insert
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     task_id: Mapped[int] = mapped_column(
         Integer, 
         ForeignKey("tasks.id", ondelete="CASCADE"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
-    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(_task_status_enum, nullable=False)
     message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        _timestamp_type,
         server_default=func.now(),
         nullable=False,
         index=True
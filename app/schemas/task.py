@@ -5,13 +5,30 @@ This module defines the request and response schemas for task operations,
 including validation rules and data transformation logic.
 """
 
+import operator
 from datetime import datetime
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.models.task import TaskPriority, TaskStatus
 
+# Valid enum values, precomputed once at import. The validators run on
+# every request, so membership is a single hash lookup instead of
+# rebuilding a list from the enum each call.
+_VALID_STATUSES = frozenset(status.value for status in TaskStatus)
+_VALID_PRIORITIES = frozenset(priority.value for priority in TaskPriority)
+_VALID_STATUSES_STR = ", ".join(sorted(_VALID_STATUSES))
+_VALID_PRIORITIES_STR = ", ".join(str(p) for p in sorted(_VALID_PRIORITIES))
+
+# Precomputed extractor for the summary fast path: one C-level attrgetter
+# call per row instead of a Python getattr per field
+_SUMMARY_FIELDS = (
+    "id", "title", "description", "status", "priority",
+    "created_at", "updated_at"
+)
+_SUMMARY_GETTER = operator.attrgetter(*_SUMMARY_FIELDS)
+
 
 class TaskBase(BaseModel):
     """
@@ -127,10 +144,8 @@ class TaskUpdate(BaseModel):
         Raises:
             ValueError: If status is not a valid TaskStatus value
         """
-        if v is not None:
-            valid_statuses = [status.value for status in TaskStatus]
-            if v not in valid_statuses:
-                raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
+        if v is not None and v not in _VALID_STATUSES:
+            raise ValueError(f"Status must be one of: {_VALID_STATUSES_STR}")
         return v
     
     @field_validator("description")
@@ -166,6 +181,29 @@ class TaskLogResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+    # Hardcoded so the trusted path skips the model_fields mapping lookup
+    _TRUSTED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "id", "task_id", "status", "message", "created_at"
+    )
+
+    @classmethod
+    def from_orm_trusted(cls, obj: object) -> "TaskLogResponse":
+        """
+        Build a response from a trusted ORM row without validation.
+
+        Database rows were validated on write, so model_construct skips
+        pydantic's validator graph entirely.
+
+        Args:
+            obj: TaskLog ORM instance
+
+        Returns:
+            Constructed TaskLogResponse instance
+        """
+        return cls.model_construct(
+            **{field: getattr(obj, field) for field in cls._TRUSTED_FIELDS}
+        )
+
 
 class TaskResponse(TaskBase):
     """
@@ -183,6 +221,28 @@ class TaskResponse(TaskBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+    _TRUSTED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "id", "title", "description", "status", "priority",
+        "created_at", "updated_at"
+    )
+
+    @classmethod
+    def from_orm_trusted(cls, obj: object) -> "TaskResponse":
+        """
+        Build a response from a trusted ORM row without validation.
+
+        Args:
+            obj: Task ORM instance with its logs loaded
+
+        Returns:
+            Constructed TaskResponse instance with nested log entries
+        """
+        data = {field: getattr(obj, field) for field in cls._TRUSTED_FIELDS}
+        data["logs"] = [
+            TaskLogResponse.from_orm_trusted(log) for log in obj.logs
+        ]
+        return cls.model_construct(**data)
+
 
 class TaskSummaryResponse(BaseModel):
     """
@@ -201,6 +261,23 @@ class TaskSummaryResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+    _TRUSTED_FIELDS: ClassVar[Tuple[str, ...]] = _SUMMARY_FIELDS
+
+    @classmethod
+    def from_orm_trusted(cls, obj: object) -> "TaskSummaryResponse":
+        """
+        Build a summary from a trusted ORM row without validation.
+
+        Args:
+            obj: Task ORM instance
+
+        Returns:
+            Constructed TaskSummaryResponse instance
+        """
+        return cls.model_construct(
+            **dict(zip(_SUMMARY_FIELDS, _SUMMARY_GETTER(obj)))
+        )
+
 
 class TaskListResponse(BaseModel):
     """
@@ -210,12 +287,22 @@ class TaskListResponse(BaseModel):
     """
     
     items: List[TaskSummaryResponse] = Field(..., description="List of tasks")
-    total: int = Field(..., description="Total number of tasks matching the query")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of tasks matching the query (omitted in cursor mode)"
+    )
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Number of items per page")
-    pages: int = Field(..., description="Total number of pages")
+    pages: Optional[int] = Field(
+        None,
+        description="Total number of pages (omitted in cursor mode)"
+    )
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for fetching the next page via keyset pagination"
+    )
 
 
 class TaskProcessResponse(BaseModel):
@@ -245,6 +332,14 @@ class TaskFilterParams(BaseModel):
     title: Optional[str] = Field(None, description="Filter by title (partial match)")
     page: int = Field(default=1, ge=1, description="Page number")
     per_page: int = Field(default=20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque keyset cursor; takes precedence over page"
+    )
+    include_total: bool = Field(
+        default=False,
+        description="Whether to compute the total result count (extra scan)"
+    )
     
     @field_validator("status")
     @classmethod
@@ -261,10 +356,8 @@ class TaskFilterParams(BaseModel):
         Raises:
             ValueError: If status is not a valid TaskStatus value
         """
-        if v is not None:
-            valid_statuses = [status.value for status in TaskStatus]
-            if v not in valid_statuses:
-                raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
+        if v is not None and v not in _VALID_STATUSES:
+            raise ValueError(f"Status must be one of: {_VALID_STATUSES_STR}")
         return v
     
     @field_validator("priority")
@@ -282,9 +375,7 @@ class TaskFilterParams(BaseModel):
         Raises:
             ValueError: If priority is not a valid TaskPriority value
         """
-        if v is not None:
-            valid_priorities = [priority.value for priority in TaskPriority]
-            if v not in valid_priorities:
-                raise ValueError(f"Priority must be one of: {', '.join(map(str, valid_priorities))}")
+        if v is not None and v not in _VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {_VALID_PRIORITIES_STR}")
         return v
     
\ No newline at end of file
@@ -6,9 +6,11 @@ providing task queue management and processing capabilities.
 """
 
 import asyncio
+import functools
 import logging
+import random
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Set
+from typing import Dict, Optional
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,6 +21,16 @@ from app.services.task_service import TaskService
 
 logger = logging.getLogger(__name__)
 
+# Simulated processing seconds indexed by priority (0=Critical .. 3=Low);
+# precomputed so the per-task path is a single tuple index instead of a
+# dict allocation and float multiply per call
+_PRIORITY_SECONDS = (2, 4, 5, 7)
+_DEFAULT_SECONDS = 5
+
+# Bound once: saves the sys.modules and module-attribute lookups in the
+# per-task work loop
+_rand = random.random
+
 
 class BackgroundTaskProcessor:
     """
@@ -30,10 +42,13 @@ class BackgroundTaskProcessor:
     
     def __init__(self):
         """Initialize the background task processor."""
-        self._processing_tasks: Set[int] = set()
         self._task_futures: Dict[int, asyncio.Task] = {}
         self._shutdown_event = asyncio.Event()
         self._max_concurrent_tasks = settings.MAX_CONCURRENT_TASKS
+        # Single source of truth for the concurrency cap. The futures dict
+        # alone tracks what is running; the semaphore enforces the limit
+        # atomically instead of a check-then-add on a separate set.
+        self._slots = asyncio.Semaphore(self._max_concurrent_tasks)
     
     async def process_task(self, task_id: int) -> bool:
         """
@@ -45,22 +60,42 @@ class BackgroundTaskProcessor:
         Returns:
             True if task was successfully queued for processing, False otherwise
         """
-        if task_id in self._processing_tasks:
+        if task_id in self._task_futures:
             logger.warning(f"Task {task_id} is already being processed")
             return False
         
-        if len(self._processing_tasks) >= self._max_concurrent_tasks:
+        if self._slots.locked():
             logger.warning(f"Maximum concurrent tasks reached ({self._max_concurrent_tasks})")
             return False
         
-        # Start processing the task
+        # No await point between the locked() check and this acquire, and a
+        # free semaphore acquires without suspending, so the slot claim is
+        # atomic on the event loop
+        await self._slots.acquire()
+        
+        # Start processing the task. Cleanup runs as a done callback so it
+        # also covers cancellation and keeps the execute path's finally
+        # block out of the per-task hot path.
         future = asyncio.create_task(self._execute_task(task_id))
         self._task_futures[task_id] = future
-        self._processing_tasks.add(task_id)
+        future.add_done_callback(
+            functools.partial(self._release_task_slot, task_id)
+        )
         
         logger.info(f"Started processing task {task_id}")
         return True
     
+    def _release_task_slot(self, task_id: int, _future: asyncio.Task) -> None:
+        """
+        Drop a finished task's bookkeeping and free its concurrency slot.
+        
+        Args:
+            task_id: ID of the task that finished
+            _future: The completed future (passed by the event loop)
+        """
+        self._task_futures.pop(task_id, None)
+        self._slots.release()
+    
     async def _execute_task(self, task_id: int) -> None:
         """
         Execute a single task with error handling.
@@ -111,11 +146,6 @@ class BackgroundTaskProcessor:
                     )
                 except Exception as completion_error:
                     logger.error(f"Error completing failed task {task_id}: {str(completion_error)}")
-            
-            finally:
-                # Clean up
-                self._processing_tasks.discard(task_id)
-                self._task_futures.pop(task_id, None)
     
     async def _perform_task_work(self, task_id: int, processing_time: int) -> bool:
         """
@@ -132,21 +162,20 @@ class BackgroundTaskProcessor:
             True if task succeeds, False if it fails
         """
         try:
-            # Simulate processing with periodic status updates
-            chunk_size = max(1, processing_time // 5)  # Update status every 20% of processing time
-            
-            for i in range(0, processing_time, chunk_size):
-                if self._shutdown_event.is_set():
-                    logger.info(f"Task {task_id} interrupted due to shutdown")
-                    return False
-                
-                await asyncio.sleep(min(chunk_size, processing_time - i))
-                progress = min(100, ((i + chunk_size) / processing_time) * 100)
-                logger.debug(f"Task {task_id} progress: {progress:.1f}%")
+            # One wait on the shutdown event instead of a sleep-and-poll
+            # loop: the event firing means early exit, the timeout expiring
+            # means the simulated work ran to completion
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(), timeout=processing_time
+                )
+                logger.info(f"Task {task_id} interrupted due to shutdown")
+                return False
+            except asyncio.TimeoutError:
+                pass
             
             # Simulate occasional failures (10% failure rate)
-            import random
-            return random.random() > 0.1
+            return _rand() > 0.1
             
         except asyncio.CancelledError:
             logger.info(f"Task {task_id} was cancelled")
@@ -166,15 +195,9 @@ class BackgroundTaskProcessor:
             Processing time in seconds
         """
         # Higher priority tasks get processed faster
-        base_time = 5
-        priority_multiplier = {
-            0: 0.5,  # Critical: 2.5 seconds
-            1: 0.8,  # High: 4 seconds
-            2: 1.0,  # Medium: 5 seconds
-            3: 1.5,  # Low: 7.5 seconds
-        }
-        
-        return int(base_time * priority_multiplier.get(priority, 1.0))
+        if 0 <= priority < len(_PRIORITY_SECONDS):
+            return _PRIORITY_SECONDS[priority]
+        return _DEFAULT_SECONDS
     
     async def get_processing_status(self) -> Dict[str, any]:
         """
@@ -183,11 +206,12 @@ class BackgroundTaskProcessor:
         Returns:
             Dictionary containing processing statistics
         """
+        active_count = len(self._task_futures)
         return {
-            "processing_tasks": list(self._processing_tasks),
-            "active_count": len(self._processing_tasks),
+            "processing_tasks": list(self._task_futures),
+            "active_count": active_count,
             "max_concurrent": self._max_concurrent_tasks,
-            "available_slots": self._max_concurrent_tasks - len(self._processing_tasks)
+            "available_slots": self._max_concurrent_tasks - active_count
         }
     
     async def stop_task(self, task_id: int) -> bool:
@@ -237,7 +261,6 @@ class BackgroundTaskProcessor:
                 for future in self._task_futures.values():
                     future.cancel()
         
-        self._processing_tasks.clear()
         self._task_futures.clear()
         logger.info("Background task processor shutdown complete")
     
@@ -249,14 +272,14 @@ class BackgroundTaskProcessor:
         Yields:
             AsyncSession: Database session
         """
+        # async with already closes the session on exit; an explicit
+        # close() in a finally block would just await a no-op a second time
         async with AsyncSessionLocal() as session:
             try:
                 yield session
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
 
 
 # Global background task processor instance
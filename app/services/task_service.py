@@ -5,14 +5,99 @@ This module contains the core business logic for task operations,
 including CRUD operations, validation, and task state management.
 """
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from typing import List, Optional, Tuple
-from sqlalchemy import and_, func, or_, select
+
+from sqlalchemy import (
+    Row,
+    String,
+    and_,
+    cast,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    text,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.cache import AsyncTTLCache
 from app.models.task import Task, TaskLog, TaskStatus
 from app.schemas.task import TaskCreate, TaskFilterParams, TaskUpdate
 
+# Short-lived cache for the statistics aggregate; concurrent requests for
+# stats coalesce into a single database scan. Invalidated on every task
+# mutation so results never lag behind writes issued through this service.
+_stats_cache = AsyncTTLCache(ttl=15.0)
+_STATS_KEY = "task_stats"
+
+# Unfiltered list totals change slowly and tolerate staleness (the
+# PostgreSQL path is a planner estimate anyway); cache them briefly so
+# repeated first-page listings skip even the estimate lookup.
+_count_cache = AsyncTTLCache(ttl=30.0)
+_COUNT_KEY = "task_count"
+
+# Columns update_task may write, fixed at class-load time: an explicit
+# whitelist instead of per-call hasattr reflection against the model.
+_UPDATABLE_FIELDS = ("title", "description", "priority", "status")
+
+# Detail responses carry only the most recent log entries; a task's full
+# history is unbounded and long-lived tasks would otherwise drag their
+# whole audit trail over the wire on every GET.
+_DETAIL_LOG_LIMIT = 50
+
+# Type of a decoded keyset cursor: (priority, created_at, id) of the last
+# row on the previous page, matching the list ordering.
+TaskCursor = Tuple[int, datetime, int]
+
+
+def encode_task_cursor(task: Task) -> str:
+    """
+    Encode a keyset pagination cursor for a task.
+
+    The cursor captures the sort key of the last row on a page so the next
+    page can be fetched with an index seek instead of OFFSET.
+
+    Args:
+        task: The last task on the current page
+
+    Returns:
+        Opaque base64-encoded cursor string
+    """
+    payload = json.dumps([task.priority, task.created_at.isoformat(), task.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_task_cursor(cursor: str) -> TaskCursor:
+    """
+    Decode a keyset pagination cursor.
+
+    Args:
+        cursor: Opaque cursor string produced by encode_task_cursor
+
+    Returns:
+        Tuple of (priority, created_at, id) for the keyset condition
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        priority, created_at, task_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return int(priority), datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, json.JSONDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+
 
 class TaskService:
     """
@@ -20,14 +105,23 @@ class TaskService:
     
     This class encapsulates all business logic related to task management,
     providing a clean interface between the API layer and data layer.
+
+    The service carries no state beyond the session it wraps and is
+    instantiated per request, so __slots__ keeps that allocation to a
+    bare object without a per-instance __dict__.
     """
-    
+
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         """
         Initialize the task service.
-        
+
         Args:
-            db: Database session for performing operations
+            db: Database session for performing operations. In production
+                this is the request's task-scoped session from get_db, so
+                every service call within one request shares a session
+                (and its pooled connection).
         """
         self.db = db
     
@@ -51,19 +145,74 @@ class TaskService:
             status=TaskStatus.PENDING.value
         )
         
+        # Flush assigns the task id (and, via eager_defaults, the server
+        # timestamps), then the initial log rides the same transaction:
+        # one commit for both inserts and no refresh SELECT afterwards
         self.db.add(task)
-        await self.db.commit()
-        await self.db.refresh(task)
-        
-        # Create initial log entry
+        await self.db.flush()
         await self._create_task_log(
-            task.id, 
-            TaskStatus.PENDING.value, 
+            task.id,
+            TaskStatus.PENDING.value,
             "Task created"
         )
-        
+        await self.db.commit()
+
+        # The create response reports an empty log list (the initial entry
+        # above is not part of it); populate the collection without a lazy
+        # load, which would raise under the async session
+        set_committed_value(task, "logs", [])
+
+        _stats_cache.invalidate(_STATS_KEY)
+        _count_cache.invalidate(_COUNT_KEY)
         return task
-    
+
+    async def create_tasks_bulk(self, tasks_data: List[TaskCreate]) -> List[Task]:
+        """
+        Create multiple tasks in a single transaction.
+
+        All rows (and their creation log entries) are flushed and
+        committed together, so N tasks cost one commit instead of N.
+
+        Args:
+            tasks_data: Task creation payloads
+
+        Returns:
+            Created task instances, in input order
+        """
+        tasks = [
+            Task(
+                title=task_data.title,
+                description=task_data.description,
+                priority=task_data.priority,
+                status=TaskStatus.PENDING.value,
+            )
+            for task_data in tasks_data
+        ]
+
+        self.db.add_all(tasks)
+        await self.db.flush()
+        # One executemany for all the creation log rows (see
+        # _create_task_log for why logs use a Core insert)
+        await self.db.execute(
+            insert(TaskLog),
+            [
+                {
+                    "task_id": task.id,
+                    "status": TaskStatus.PENDING.value,
+                    "message": "Task created",
+                }
+                for task in tasks
+            ],
+        )
+        await self.db.commit()
+
+        for task in tasks:
+            set_committed_value(task, "logs", [])
+
+        _stats_cache.invalidate(_STATS_KEY)
+        _count_cache.invalidate(_COUNT_KEY)
+        return tasks
+
     async def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
         Retrieve a task by its ID.
@@ -71,70 +220,235 @@ class TaskService:
         Args:
             task_id: The ID of the task to retrieve
             
+        Returns:
+            Task instance if found, None otherwise, with its most recent
+            log entries (up to _DETAIL_LOG_LIMIT) attached
+        """
+        task = await self._get_task_bare(task_id)
+        if task is None:
+            return None
+
+        await self._attach_recent_logs(task)
+        return task
+
+    async def _get_task_bare(self, task_id: int) -> Optional[Task]:
+        """
+        Fetch a task row without touching its logs.
+
+        Mutation paths need only the task itself; loading the log window
+        there would cost an extra query whose results are never read.
+
+        Args:
+            task_id: The ID of the task to retrieve
+
         Returns:
             Task instance if found, None otherwise
         """
-        query = (
-            select(Task)
-            .options(selectinload(Task.logs))
-            .where(Task.id == task_id)
+        # lambda_stmt caches the expression construction and SQL string
+        # across calls; the closed-over task_id is extracted as a bound
+        # parameter on each execution
+        query = lambda_stmt(
+            lambda: select(Task).where(Task.id == task_id)
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
+
+    async def _attach_recent_logs(self, task: Task) -> None:
+        """
+        Attach the bounded recent-log window to a task instance.
+
+        Loads the newest _DETAIL_LOG_LIMIT log entries explicitly instead
+        of eager-loading the whole collection, and populates the
+        relationship without triggering a lazy load.
+
+        Args:
+            task: Task instance to attach logs to
+        """
+        task_id = task.id
+        logs_query = lambda_stmt(
+            lambda: select(TaskLog)
+            .where(TaskLog.task_id == task_id)
+            .order_by(TaskLog.created_at.desc(), TaskLog.id.desc())
+            .limit(_DETAIL_LOG_LIMIT)
+        )
+        logs_result = await self.db.execute(logs_query)
+        set_committed_value(task, "logs", list(logs_result.scalars().all()))
     
     async def get_tasks(
-        self, 
-        filters: TaskFilterParams
-    ) -> Tuple[List[Task], int]:
+        self,
+        filters: TaskFilterParams,
+        cursor: Optional[TaskCursor] = None
+    ) -> Tuple[List[Task], Optional[int]]:
         """
         Retrieve tasks with filtering and pagination.
-        
+
+        Supports two pagination modes: classic page/offset pagination and
+        keyset (cursor) pagination. In cursor mode the query seeks directly
+        to the page start via the sort key instead of scanning and discarding
+        offset rows. The total count is an extra scan of the filter predicate
+        and is only computed when filters.include_total is set (never in
+        cursor mode); otherwise one extra row is fetched so the caller can
+        detect whether a next page exists.
+
         Args:
             filters: Filter and pagination parameters
-            
+            cursor: Optional decoded keyset cursor (priority, created_at, id)
+
         Returns:
-            Tuple of (tasks list, total count)
+            Tuple of (tasks list, total count). The total count is None
+            unless requested via include_total; when it is None the list may
+            contain one extra row beyond per_page.
         """
-        # Build base query
-        query = select(Task)
-        count_query = select(func.count(Task.id))
-        
+        # Build base query. Summaries never touch logs; noload guards
+        # against an accidental lazy load on top of the lazy default.
+        # Column pruning via load_only does not apply here: the summary
+        # schema renders every Task column, so the full row is needed.
+        query = select(Task).options(noload(Task.logs))
+
         # Apply filters
         conditions = []
-        
+
         if filters.status:
             conditions.append(Task.status == filters.status)
-        
+
         if filters.priority is not None:
             conditions.append(Task.priority == filters.priority)
-        
+
         if filters.title:
             conditions.append(
                 Task.title.ilike(f"%{filters.title}%")
             )
-        
+
         if conditions:
-            filter_condition = and_(*conditions)
-            query = query.where(filter_condition)
-            count_query = count_query.where(filter_condition)
-        
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total_count = count_result.scalar_one()
-        
-        # Apply pagination and ordering
-        query = (
+            query = query.where(and_(*conditions))
+
+        query = query.order_by(
+            Task.priority.asc(), Task.created_at.desc(), Task.id.desc()
+        )
+
+        if cursor is not None:
+            # Keyset mode: seek past the last row of the previous page with
+            # the full row-wise comparison matching the ORDER BY. id alone
+            # is not a safe tiebreaker: now() is the transaction-start
+            # timestamp on PostgreSQL, so under concurrent writers a higher
+            # id can carry an earlier created_at.
+            last_priority, last_created_at, last_id = cursor
+            query = (
+                query
+                .where(
+                    or_(
+                        Task.priority > last_priority,
+                        and_(
+                            Task.priority == last_priority,
+                            or_(
+                                Task.created_at < last_created_at,
+                                and_(
+                                    Task.created_at == last_created_at,
+                                    Task.id < last_id,
+                                ),
+                            ),
+                        ),
+                    )
+                )
+                .limit(filters.per_page + 1)
+            )
+
+            result = await self.db.execute(query)
+            return list(result.scalars().all()), None
+
+        # Page mode
+        offset = (filters.page - 1) * filters.per_page
+
+        if not filters.include_total:
+            # Fetch one extra row so the caller can derive has_next without
+            # a count
+            query = query.offset(offset).limit(filters.per_page + 1)
+            result = await self.db.execute(query)
+            return list(result.scalars().all()), None
+
+        if not conditions:
+            # Unfiltered totals can use the cheap planner estimate instead
+            # of scanning the filter predicate a second time. The estimate
+            # lags writes though, so has_next must not be derived from it:
+            # fetch one lookahead row and reconcile the total with what the
+            # page actually shows, making count-based has_next exact.
+            total_count = await self.get_approx_task_count()
+            query = query.offset(offset).limit(filters.per_page + 1)
+            result = await self.db.execute(query)
+            rows = list(result.scalars().all())
+
+            if len(rows) > filters.per_page:
+                # A next page provably exists; raise the total to at least
+                # one row past this page in case the estimate is behind
+                total_count = max(
+                    total_count, offset + filters.per_page + 1
+                )
+                return rows[:filters.per_page], total_count
+
+            if rows or not offset:
+                # The listing ends on this page, so the exact total is
+                # known for free
+                return rows, offset + len(rows)
+
+            # Page beyond the last row: fall back to an exact count
+            count_result = await self.db.execute(select(func.count(Task.id)))
+            return [], count_result.scalar_one()
+
+        # Filtered totals: piggyback the count on the page query via a
+        # window function so data and total arrive in one round trip
+        windowed = (
             query
-            .order_by(Task.priority.asc(), Task.created_at.desc())
-            .offset((filters.page - 1) * filters.per_page)
+            .add_columns(func.count().over().label("total"))
+            .offset(offset)
             .limit(filters.per_page)
         )
-        
-        # Execute query
-        result = await self.db.execute(query)
-        tasks = result.scalars().all()
-        
-        return list(tasks), total_count
+        rows = (await self.db.execute(windowed)).all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+
+        # Page beyond the last row: no rows carry the window count, so fall
+        # back to a plain count of the filter predicate
+        count_query = select(func.count(Task.id)).where(and_(*conditions))
+        count_result = await self.db.execute(count_query)
+        return [], count_result.scalar_one()
+
+    async def get_approx_task_count(self) -> int:
+        """
+        Get a fast approximate count of all tasks.
+
+        On PostgreSQL this reads the planner's reltuples estimate, which is
+        maintained by autovacuum/ANALYZE and avoids a full index scan. Other
+        backends (and freshly created tables with no statistics) fall back
+        to an exact COUNT.
+
+        Returns:
+            Approximate (PostgreSQL) or exact total number of tasks
+        """
+        return await _count_cache.get_or_compute(
+            _COUNT_KEY, self._compute_approx_task_count
+        )
+
+    async def _compute_approx_task_count(self) -> int:
+        """
+        Compute the approximate task count from the database.
+
+        Returns:
+            Approximate (PostgreSQL) or exact total number of tasks
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            result = await self.db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = 'tasks'::regclass"
+                )
+            )
+            estimate = result.scalar_one_or_none()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        result = await self.db.execute(select(func.count(Task.id)))
+        return result.scalar_one()
     
     async def update_task(
         self, 
@@ -155,45 +469,78 @@ class TaskService:
             ValueError: If trying to update a completed task's non-status fields
         """
         try:
-            task = await self.get_task_by_id(task_id)
-            if not task:
+            update_data = task_data.model_dump(exclude_unset=True)
+            if not update_data:
+                return await self.get_task_by_id(task_id)
+
+            # Narrow pre-image read: only the columns being updated (plus
+            # status, which the change log always references) instead of
+            # hydrating the full row
+            preimage_fields = dict.fromkeys(["status", *update_data])
+            preimage = (
+                await self.db.execute(
+                    select(
+                        *(getattr(Task, field) for field in preimage_fields)
+                    ).where(Task.id == task_id)
+                )
+            ).first()
+            if preimage is None:
                 return None
-            
-            # Track what changed for logging
+
+            old_values = dict(zip(preimage_fields, preimage))
+            old_status = old_values["status"]
+
+            # Track what changed for logging; untouched fields stay out of
+            # the UPDATE entirely and diff strings are only formatted if a
+            # log entry actually needs them
             changes = []
-            old_status = task.status
-            
-            # Update fields
-            update_data = task_data.model_dump(exclude_unset=True)
-            
-            for field, value in update_data.items():
-                if hasattr(task, field) and getattr(task, field) != value:
-                    old_value = getattr(task, field)
-                    setattr(task, field, value)
-                    changes.append(f"{field}: {old_value} -> {value}")
-            
+            changed_values = {}
+            for field in _UPDATABLE_FIELDS:
+                if field not in update_data:
+                    continue
+                value = update_data[field]
+                if old_values[field] != value:
+                    changed_values[field] = value
+                    changes.append((field, old_values[field], value))
+
             if not changes:
-                return task
-            
-            await self.db.commit()
-            await self.db.refresh(task)
-            
-            # Log status change if status was updated
-            if task.status != old_status:
+                return await self.get_task_by_id(task_id)
+
+            # Single UPDATE with RETURNING: the write and the refreshed row
+            # (including the onupdate timestamp) arrive in one round trip
+            result = await self.db.execute(
+                update(Task)
+                .where(Task.id == task_id)
+                .values(**changed_values)
+                .returning(Task)
+            )
+            task = result.scalar_one()
+            new_status = task.status
+
+            # Stage the log entries alongside the field updates so the
+            # whole mutation is one transaction and one commit
+            if new_status != old_status:
                 await self._create_task_log(
-                    task.id,
-                    task.status,
-                    f"Status changed from {old_status} to {task.status}"
+                    task_id,
+                    new_status,
+                    f"Status changed from {old_status} to {new_status}"
                 )
-            
-            # Log other changes
-            if len(changes) > 1 or (len(changes) == 1 and "status" not in changes[0]):
+
+            if len(changes) > 1 or changes[0][0] != "status":
                 await self._create_task_log(
-                    task.id,
-                    task.status,
-                    f"Task updated: {', '.join(changes)}"
+                    task_id,
+                    new_status,
+                    "Task updated: " + ", ".join(
+                        f"{field}: {old} -> {new}" for field, old, new in changes
+                    )
                 )
-            
+
+            await self.db.commit()
+            _stats_cache.invalidate(_STATS_KEY)
+
+            # Attach the recent log window (including the entries written
+            # here) so the response build does not lazy-load
+            await self._attach_recent_logs(task)
             return task
         except Exception as e:
             await self.db.rollback()
@@ -213,7 +560,7 @@ class TaskService:
             ValueError: If trying to delete a task that is currently processing
         """
         try:
-            task = await self.get_task_by_id(task_id)
+            task = await self._get_task_bare(task_id)
             if not task:
                 return False
             
@@ -222,6 +569,8 @@ class TaskService:
             
             await self.db.delete(task)
             await self.db.commit()
+            _stats_cache.invalidate(_STATS_KEY)
+            _count_cache.invalidate(_COUNT_KEY)
             return True
         except ValueError:
             # Re-raise ValueError for business logic errors
@@ -243,25 +592,47 @@ class TaskService:
         Raises:
             ValueError: If task cannot be processed
         """
-        task = await self.get_task_by_id(task_id)
-        if not task:
-            return None
+        # Single UPDATE with the processability guard in the WHERE clause:
+        # no ORM load, no separate validation read, and RETURNING hands
+        # back the fresh row (including the onupdate timestamp)
+        result = await self.db.execute(
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.status.in_(
+                    [TaskStatus.PENDING.value, TaskStatus.FAILED.value]
+                ),
+            )
+            .values(status=TaskStatus.IN_PROGRESS.value)
+            .returning(Task)
+        )
+        task = result.scalar_one_or_none()
         
-        if not task.can_be_processed():
+        if task is None:
+            # Nothing matched: distinguish a missing task from one in a
+            # non-processable state
+            status_query = lambda_stmt(
+                lambda: select(Task.status).where(Task.id == task_id)
+            )
+            current_status = (
+                await self.db.execute(status_query)
+            ).scalar_one_or_none()
+            if current_status is None:
+                return None
             raise ValueError(
-                f"Task with status '{task.status}' cannot be processed. "
+                f"Task with status '{current_status}' cannot be processed. "
                 f"Only tasks with status 'pending' or 'failed' can be processed."
             )
         
-        task.status = TaskStatus.IN_PROGRESS.value
-        await self.db.commit()
-        await self.db.refresh(task)
-        
+        # Stage the log alongside the status change so the transition is
+        # one UPDATE + INSERT in a single transaction and commit
         await self._create_task_log(
             task.id,
             TaskStatus.IN_PROGRESS.value,
             "Task processing started"
         )
+        await self.db.commit()
+        _stats_cache.invalidate(_STATS_KEY)
         
         return task
     
@@ -282,70 +653,113 @@ class TaskService:
         Returns:
             Updated task instance if found, None otherwise
         """
-        task = await self.get_task_by_id(task_id)
-        if not task:
-            return None
-        
         new_status = TaskStatus.COMPLETED.value if success else TaskStatus.FAILED.value
-        task.status = new_status
         
-        await self.db.commit()
-        await self.db.refresh(task)
+        # Same single-UPDATE pattern as start_task_processing
+        result = await self.db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(status=new_status)
+            .returning(Task)
+        )
+        task = result.scalar_one_or_none()
+        if task is None:
+            return None
         
         log_message = message or (
             "Task completed successfully" if success else "Task processing failed"
         )
         
         await self._create_task_log(task.id, new_status, log_message)
+        await self.db.commit()
+        _stats_cache.invalidate(_STATS_KEY)
         
         return task
     
     async def get_task_statistics(self) -> dict:
         """
         Get task statistics summary.
-        
+
+        Results are memoized for a short period; concurrent callers share a
+        single computation and task mutations invalidate the cached value.
+
         Returns:
             Dictionary containing task counts by status and priority
         """
-        # Count by status
-        status_query = (
-            select(Task.status, func.count(Task.id))
-            .group_by(Task.status)
+        return await _stats_cache.get_or_compute(
+            _STATS_KEY, self._compute_task_statistics
         )
-        status_result = await self.db.execute(status_query)
-        status_counts = dict(status_result.all())
-        
-        # Count by priority
-        priority_query = (
-            select(Task.priority, func.count(Task.id))
-            .group_by(Task.priority)
+
+    async def _compute_task_statistics(self) -> dict:
+        """
+        Compute task statistics from the database.
+
+        The aggregates ride one UNION ALL statement rather than being
+        gathered concurrently: the session serializes on a single
+        connection, and one scan beats three overlapping ones anyway.
+
+        Returns:
+            Dictionary containing task counts by status and priority
+        """
+        # Both group-bys ride a single UNION ALL statement, so the
+        # aggregates arrive in one round trip. The keys are cast to text
+        # to give the branches a common shape; priorities are converted
+        # back below.
+        stats_query = union_all(
+            select(
+                literal("status").label("dim"),
+                cast(Task.status, String).label("key"),
+                func.count(Task.id).label("count"),
+            ).group_by(Task.status),
+            select(
+                literal("priority"),
+                cast(Task.priority, String),
+                func.count(Task.id),
+            ).group_by(Task.priority),
         )
-        priority_result = await self.db.execute(priority_query)
-        priority_counts = dict(priority_result.all())
-        
-        # Total count
-        total_query = select(func.count(Task.id))
-        total_result = await self.db.execute(total_query)
-        total_count = total_result.scalar_one()
-        
+        result = await self.db.execute(stats_query)
+
+        status_counts: dict = {}
+        priority_counts: dict = {}
+        for dim, key, count in result.all():
+            if dim == "status":
+                status_counts[key] = count
+            else:
+                priority_counts[int(key)] = count
+
+        # The status counts partition all tasks, so the total falls out of
+        # them without another aggregate
+        total_count = sum(status_counts.values())
+
         return {
             "total_tasks": total_count,
             "by_status": status_counts,
             "by_priority": priority_counts
         }
     
-    async def get_tasks_for_processing(self, limit: int = 10) -> List[Task]:
+    async def get_tasks_for_processing(self, limit: int = 10) -> List[Row]:
         """
         Get tasks that are ready for processing.
-        
+
+        Returns plain (id, priority, status) rows rather than Task
+        instances: the scheduler only inspects those columns, so ORM
+        hydration and the unused column payload would be wasted work on a
+        hot polling path. Row fields read like attributes (row.id, ...).
+
+        Concurrent workers each get a disjoint batch: FOR UPDATE SKIP
+        LOCKED makes the database skip rows another worker has already
+        claimed instead of blocking on them or handing out duplicates.
+        SQLite has no row locks and ignores the clause, which is fine for
+        tests.
+
         Args:
             limit: Maximum number of tasks to return
-            
+
         Returns:
-            List of tasks ready for processing
+            List of (id, priority, status) rows ready for processing
         """
-        query = (
-            select(Task)
+        query = lambda_stmt(
+            lambda: select(Task.id, Task.priority, Task.status)
             .where(
                 or_(
                     Task.status == TaskStatus.PENDING.value,
@@ -354,37 +768,36 @@ class TaskService:
             )
             .order_by(Task.priority.asc(), Task.created_at.asc())
             .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        
+
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
     
     async def _create_task_log(
-        self, 
-        task_id: int, 
-        status: str, 
+        self,
+        task_id: int,
+        status: str,
         message: str
-    ) -> TaskLog:
+    ) -> None:
         """
-        Create a task log entry.
-        
+        Stage a task log entry on the caller's transaction.
+
+        Log rows are written through a Core insert: they are append-only
+        and never read back in the writing request, so the ORM
+        unit-of-work bookkeeping (identity map, refresh round trip) is
+        pure overhead here. The insert deliberately does not commit —
+        riding the state change's own transaction keeps the log atomic
+        with it at no extra fsync, which is why these writes are not
+        deferred to a background queue.
+
         Args:
             task_id: ID of the associated task
             status: Status to log
             message: Log message
-            
-        Returns:
-            Created task log instance
         """
-        log = TaskLog(
-            task_id=task_id,
-            status=status,
-            message=message
+        await self.db.execute(
+            insert(TaskLog),
+            [{"task_id": task_id, "status": status, "message": message}],
         )
-        
-        self.db.add(log)
-        await self.db.commit()
-        await self.db.refresh(log)
-        
-        return log
     
\ No newline at end of file
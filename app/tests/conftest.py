@@ -5,13 +5,16 @@ This module provides shared test fixtures and configuration
 for the test suite, including database setup and client fixtures.
 """
 
-import asyncio
 from typing import AsyncGenerator, Generator
 
+import httpx
+import orjson
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -20,9 +23,14 @@ from app.core.config import TestSettings
 from app.core.database import Base, get_db
 from app.main import create_application
 from app.models.task import Task, TaskLog
+from app.services import task_service
 
-# Test database URL - using SQLite for faster tests
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_db.sqlite"
+# Test database URL - in-memory SQLite; StaticPool pins the single
+# connection so every session sees the same database. This also makes the
+# suite safe under pytest-xdist (-n auto): each worker is its own process
+# and therefore gets its own private in-memory database, so no per-worker
+# naming is needed.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 # Create test engine
 test_engine = create_async_engine(
@@ -32,6 +40,24 @@ test_engine = create_async_engine(
     echo=False
 )
 
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, _connection_record) -> None:
+    """Enable foreign keys (off by default) and drop durability overhead."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+    # Disable the driver's implicit transaction handling so SAVEPOINTs
+    # (used for per-test isolation below) work correctly
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn) -> None:
+    """Emit BEGIN explicitly; see the isolation_level override above."""
+    conn.exec_driver_sql("BEGIN")
+
 # Create test session factory
 TestSessionLocal = sessionmaker(
     test_engine,
@@ -40,85 +66,178 @@ TestSessionLocal = sessionmaker(
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+@pytest.fixture(scope="session", autouse=True)
+def _fast_response_json() -> Generator[None, None, None]:
     """
-    Create an event loop for the test session.
-    
-    Yields:
-        Event loop for async tests
+    Decode response bodies with orjson for the duration of the session.
+
+    Nearly every integration test calls response.json(); routing those
+    calls through orjson instead of the stdlib decoder is free speed.
+    Keyword arguments fall back to the original implementation.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    original = httpx.Response.json
 
+    def _json(self: httpx.Response, **kwargs):
+        if kwargs:
+            return original(self, **kwargs)
+        return orjson.loads(self.content)
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    httpx.Response.json = _json
+    yield
+    httpx.Response.json = original
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _database_schema() -> AsyncGenerator[None, None]:
     """
-    Create a database session for testing.
-    
-    This fixture creates a fresh database for each test function,
-    ensuring test isolation.
-    
-    Yields:
-        Database session for testing
+    Create the database schema once for the whole test session.
+
+    Per-test isolation is handled by transaction rollback in db_session,
+    so the DDL only needs to run once.
     """
-    # Create tables
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
-    # Create session
-    async with TestSessionLocal() as session:
-        yield session
-    
-    # Drop tables
+
+    yield
+
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def db_session(_database_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a database session for testing.
+
+    Each test runs inside an outer transaction that is rolled back at
+    teardown; session.commit() calls inside the test only release
+    savepoints, so every test still sees an empty database.
+
+    Yields:
+        Database session for testing
+    """
+    # Module-level service caches would otherwise leak values between
+    # tests (fixtures insert rows without going through the service)
+    task_service._stats_cache.invalidate()
+    task_service._count_cache.invalidate()
+
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = TestSessionLocal(
+            bind=conn, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+# The session the get_db override should hand out for the current test.
+# Kept in a module-level slot so the clients (and the app's override) can
+# be session-scoped while each test still talks to its own rolled-back
+# session.
+_current_db_session: AsyncSession = None
+
+
+async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield the current test's database session."""
+    yield _current_db_session
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    Create the FastAPI application once for the whole test session.
+
+    Building the app compiles the route tree and dependency graph, which
+    is pure fixed cost. The get_db override is installed once and reads
+    the per-test session slot, so nothing app-level changes between tests.
+
+    Returns:
+        FastAPI application instance
+    """
+    application = create_application()
+    application.dependency_overrides[get_db] = _override_get_db
+    return application
+
+
+@pytest.fixture(scope="session")
+def _test_client(app: FastAPI) -> Generator[TestClient, None, None]:
+    """
+    Create the shared sync test client (and enter the app lifespan) once.
+
+    Yields:
+        FastAPI test client
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(db_session: AsyncSession) -> TestClient:
+def client(
+    _test_client: TestClient, db_session: AsyncSession
+) -> Generator[TestClient, None, None]:
     """
-    Create a test client with database dependency override.
-    
+    Provide the shared test client wired to this test's database session.
+
     Args:
+        _test_client: Session-scoped test client
         db_session: Test database session
-        
+
+    Yields:
+        FastAPI test client
+    """
+    global _current_db_session
+    _current_db_session = db_session
+    try:
+        yield _test_client
+    finally:
+        _current_db_session = None
+
+
+@pytest.fixture
+def validation_client(_test_client: TestClient) -> TestClient:
+    """
+    Provide the shared test client without any database setup.
+
+    For tests that only assert 422 validation errors the request is
+    rejected before the handler runs, so there is no reason to pay for
+    the per-test database transaction that the client fixture sets up.
+
+    Args:
+        _test_client: Session-scoped test client
+
     Returns:
         FastAPI test client
     """
-    app = create_application()
-    
-    async def override_get_db():
-        yield db_session
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    with TestClient(app) as test_client:
-        yield test_client
+    return _test_client
 
 
 @pytest_asyncio.fixture
-async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def async_client(
+    app: FastAPI, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
     """
-    Create an async test client with database dependency override.
-    
+    Create an async test client wired to this test's database session.
+
     Args:
+        app: Shared FastAPI application
         db_session: Test database session
-        
+
     Yields:
         Async HTTP client for testing
     """
-    app = create_application()
-    
-    async def override_get_db():
-        yield db_session
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    async with AsyncClient(app=app, base_url="http://test") as async_test_client:
-        yield async_test_client
+    global _current_db_session
+    _current_db_session = db_session
+    try:
+        # ASGITransport calls the app directly — no sockets, no server task
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as async_test_client:
+            yield async_test_client
+    finally:
+        _current_db_session = None
 
 
 @pytest_asyncio.fixture
@@ -138,64 +257,132 @@ async def sample_task(db_session: AsyncSession) -> Task:
         priority=2,
         status="pending"
     )
-    
+
+    # eager_defaults on the mapper brings back the server-generated id and
+    # timestamps with the INSERT itself, so no refresh SELECT is needed;
+    # the commit only releases a savepoint under the per-test transaction
     db_session.add(task)
     await db_session.commit()
-    await db_session.refresh(task)
-    
+
     return task
 
 
+@pytest_asyncio.fixture(scope="module")
+async def sample_tasks(_database_schema: None) -> AsyncGenerator[list[Task], None]:
+    """
+    Create the shared read-only sample tasks once per test module.
+
+    None of the consuming tests mutate these rows directly (service-level
+    mutations happen inside each test's rolled-back transaction), so they
+    are committed for real once and removed again when the module
+    finishes, instead of being re-inserted for every test.
+
+    Args:
+        _database_schema: Session-wide schema fixture
+
+    Yields:
+        List of sample task instances
+    """
+    session = TestSessionLocal()
+    # One multi-row INSERT instead of per-object unit-of-work flushes; the
+    # follow-up select hydrates the rows (with server-generated
+    # timestamps) in a single round trip
+    await session.execute(
+        insert(Task),
+        [
+            {
+                "title": "High Priority Task",
+                "description": "This is a high priority task",
+                "priority": 1,
+                "status": "pending",
+            },
+            {
+                "title": "Medium Priority Task",
+                "description": "This is a medium priority task",
+                "priority": 2,
+                "status": "in_progress",
+            },
+            {
+                "title": "Low Priority Task",
+                "description": "This is a low priority task",
+                "priority": 3,
+                "status": "completed",
+            },
+            {
+                "title": "Another Task",
+                "description": "Another test task",
+                "priority": 2,
+                "status": "failed",
+            },
+        ],
+    )
+    await session.commit()
+
+    result = await session.execute(select(Task).order_by(Task.id))
+    tasks = list(result.scalars().all())
+    await session.close()
+
+    yield tasks
+
+    session = TestSessionLocal()
+    await session.execute(
+        delete(Task).where(Task.id.in_([task.id for task in tasks]))
+    )
+    await session.commit()
+    await session.close()
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
 @pytest_asyncio.fixture
-async def sample_tasks(db_session: AsyncSession) -> list[Task]:
+async def seed_tasks(db_session: AsyncSession):
     """
-    Create multiple sample tasks for testing.
-    
+    Provide a helper that bulk-inserts task rows straight into the database.
+
+    For tests that only need rows to exist, this skips the HTTP stack and
+    Pydantic validation entirely: one Core executemany, one commit.
+
     Args:
         db_session: Test database session
-        
+
     Returns:
-        List of sample task instances
+        Async callable taking a list of column dicts, returning the new ids
     """
-    tasks = [
-        Task(
-            title="High Priority Task",
-            description="This is a high priority task",
-            priority=1,
-            status="pending"
-        ),
-        Task(
-            title="Medium Priority Task",
-            description="This is a medium priority task",
-            priority=2,
-            status="in_progress"
-        ),
-        Task(
-            title="Low Priority Task",
-            description="This is a low priority task",
-            priority=3,
-            status="completed"
-        ),
-        Task(
-            title="Another Task",
-            description="Another test task",
-            priority=2,
-            status="failed"
+    async def _seed(specs: list[dict]) -> list[int]:
+        result = await db_session.execute(
+            insert(Task).returning(Task.id), specs
         )
-    ]
-    
-    for task in tasks:
-        db_session.add(task)
-    
-    await db_session.commit()
-    
-    for task in tasks:
-        await db_session.refresh(task)
-    
-    return tasks
+        ids = [row[0] for row in result]
+        await db_session.commit()
+        return ids
+
+    return _seed
 
 
 @pytest.fixture
+def created_task_id(client: TestClient, sample_task_json: bytes) -> int:
+    """
+    Create one task through the API and return its id.
+
+    Most mutation tests only need an existing task to operate on; sharing
+    this bootstrap POST keeps each of them to a single request through
+    the HTTP stack.
+
+    Args:
+        client: FastAPI test client
+        sample_task_json: Pre-serialized sample task payload
+
+    Returns:
+        ID of the created task
+    """
+    response = client.post(
+        "/api/v1/tasks/", content=sample_task_json, headers=_JSON_HEADERS
+    )
+    return response.json()["id"]
+
+
+@pytest.fixture(scope="session")
 def sample_task_data() -> dict:
     """
     Sample task data for API testing.
@@ -210,6 +397,23 @@ def sample_task_data() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def sample_task_json(sample_task_data: dict) -> bytes:
+    """
+    Sample task data pre-serialized to JSON bytes.
+
+    Serialized once per session so tests that only need to POST the
+    payload skip httpx's per-request JSON encoding.
+
+    Args:
+        sample_task_data: Sample task data fixture
+
+    Returns:
+        JSON-encoded sample task payload
+    """
+    return orjson.dumps(sample_task_data)
+
+
 @pytest.fixture
 def sample_task_update_data() -> dict:
     """
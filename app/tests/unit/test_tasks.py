@@ -6,6 +6,7 @@ testing business logic and data operations.
 """
 
 import pytest
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.task import Task, TaskStatus
@@ -13,18 +14,30 @@ from app.schemas.task import TaskCreate, TaskFilterParams, TaskUpdate
 from app.services.task_service import TaskService
 
 
+@pytest.fixture
+def task_service(db_session: AsyncSession) -> TaskService:
+    """
+    Create a TaskService bound to the test database session.
+
+    Args:
+        db_session: Test database session
+
+    Returns:
+        Service instance under test
+    """
+    return TaskService(db_session)
+
+
 class TestTaskService:
     """Test cases for TaskService class."""
     
-    @pytest.mark.asyncio
-    async def test_create_task(self, db_session: AsyncSession):
+    async def test_create_task(self, task_service: TaskService):
         """
         Test task creation.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
         """
-        task_service = TaskService(db_session)
         task_data = TaskCreate(
             title="Test Task",
             description="Test Description",
@@ -41,48 +54,56 @@ class TestTaskService:
         assert task.created_at is not None
         assert task.updated_at is not None
     
-    @pytest.mark.asyncio
-    async def test_get_task_by_id(self, db_session: AsyncSession, sample_task: Task):
+    async def test_create_tasks_bulk(self, task_service: TaskService):
+        """
+        Test creating several tasks in one batch.
+
+        Args:
+            task_service: Task service fixture
+        """
+        tasks = await task_service.create_tasks_bulk(
+            [TaskCreate(title=f"Task {i}", priority=2) for i in range(3)]
+        )
+
+        assert len(tasks) == 3
+        assert all(task.id is not None for task in tasks)
+        assert all(task.status == TaskStatus.PENDING.value for task in tasks)
+        assert [task.title for task in tasks] == ["Task 0", "Task 1", "Task 2"]
+
+    async def test_get_task_by_id(self, task_service: TaskService, sample_task: Task):
         """
         Test retrieving a task by ID.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
-        
         retrieved_task = await task_service.get_task_by_id(sample_task.id)
         
         assert retrieved_task is not None
         assert retrieved_task.id == sample_task.id
         assert retrieved_task.title == sample_task.title
     
-    @pytest.mark.asyncio
-    async def test_get_task_by_id_not_found(self, db_session: AsyncSession):
+    async def test_get_task_by_id_not_found(self, task_service: TaskService):
         """
         Test retrieving a non-existent task.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
         """
-        task_service = TaskService(db_session)
-        
         task = await task_service.get_task_by_id(99999)
         
         assert task is None
     
-    @pytest.mark.asyncio
-    async def test_get_tasks_no_filters(self, db_session: AsyncSession, sample_tasks: list[Task]):
+    async def test_get_tasks_no_filters(self, task_service: TaskService, sample_tasks: list[Task]):
         """
         Test retrieving all tasks without filters.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_tasks: Sample tasks fixture
         """
-        task_service = TaskService(db_session)
-        filters = TaskFilterParams(page=1, per_page=10)
+        filters = TaskFilterParams(page=1, per_page=10, include_total=True)
         
         tasks, total_count = await task_service.get_tasks(filters)
         
@@ -91,71 +112,52 @@ class TestTaskService:
         # Tasks should be ordered by priority (asc) then created_at (desc)
         assert tasks[0].priority == 1  # High priority first
     
-    @pytest.mark.asyncio
-    async def test_get_tasks_with_status_filter(self, db_session: AsyncSession, sample_tasks: list[Task]):
-        """
-        Test retrieving tasks with status filter.
-        
-        Args:
-            db_session: Test database session
-            sample_tasks: Sample tasks fixture
-        """
-        task_service = TaskService(db_session)
-        filters = TaskFilterParams(status="pending", page=1, per_page=10)
-        
-        tasks, total_count = await task_service.get_tasks(filters)
-        
-        assert len(tasks) == 1
-        assert total_count == 1
-        assert all(task.status == "pending" for task in tasks)
-    
-    @pytest.mark.asyncio
-    async def test_get_tasks_with_priority_filter(self, db_session: AsyncSession, sample_tasks: list[Task]):
-        """
-        Test retrieving tasks with priority filter.
-        
-        Args:
-            db_session: Test database session
-            sample_tasks: Sample tasks fixture
-        """
-        task_service = TaskService(db_session)
-        filters = TaskFilterParams(priority=2, page=1, per_page=10)
-        
-        tasks, total_count = await task_service.get_tasks(filters)
-        
-        assert len(tasks) == 2
-        assert total_count == 2
-        assert all(task.priority == 2 for task in tasks)
-    
-    @pytest.mark.asyncio
-    async def test_get_tasks_with_title_filter(self, db_session: AsyncSession, sample_tasks: list[Task]):
-        """
-        Test retrieving tasks with title filter.
-        
+    @pytest.mark.parametrize(
+        "filter_kwargs, expected_count, predicate",
+        [
+            ({"status": "pending"}, 1, lambda task: task.status == "pending"),
+            ({"priority": 2}, 2, lambda task: task.priority == 2),
+            ({"title": "High"}, 1, lambda task: "High" in task.title),
+        ],
+        ids=["status", "priority", "title"],
+    )
+    async def test_get_tasks_with_filter(
+        self,
+        task_service: TaskService,
+        sample_tasks: list[Task],
+        filter_kwargs: dict,
+        expected_count: int,
+        predicate,
+    ):
+        """
+        Test retrieving tasks with each single-field filter.
+
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_tasks: Sample tasks fixture
+            filter_kwargs: Filter field under test
+            expected_count: Expected number of matching tasks
+            predicate: Row-level check every result must satisfy
         """
-        task_service = TaskService(db_session)
-        filters = TaskFilterParams(title="High", page=1, per_page=10)
-        
+        filters = TaskFilterParams(
+            page=1, per_page=10, include_total=True, **filter_kwargs
+        )
+
         tasks, total_count = await task_service.get_tasks(filters)
-        
-        assert len(tasks) == 1
-        assert total_count == 1
-        assert "High" in tasks[0].title
+
+        assert len(tasks) == expected_count
+        assert total_count == expected_count
+        assert all(predicate(task) for task in tasks)
     
-    @pytest.mark.asyncio
-    async def test_get_tasks_pagination(self, db_session: AsyncSession, sample_tasks: list[Task]):
+    async def test_get_tasks_pagination(self, task_service: TaskService, sample_tasks: list[Task]):
         """
         Test task pagination.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_tasks: Sample tasks fixture
         """
-        task_service = TaskService(db_session)
-        filters = TaskFilterParams(page=1, per_page=2)
+        filters = TaskFilterParams(page=1, per_page=2, include_total=True)
         
         tasks, total_count = await task_service.get_tasks(filters)
         
@@ -163,22 +165,20 @@ class TestTaskService:
         assert total_count == 4
         
         # Test second page
-        filters = TaskFilterParams(page=2, per_page=2)
+        filters = TaskFilterParams(page=2, per_page=2, include_total=True)
         tasks, total_count = await task_service.get_tasks(filters)
         
         assert len(tasks) == 2
         assert total_count == 4
     
-    @pytest.mark.asyncio
-    async def test_update_task(self, db_session: AsyncSession, sample_task: Task):
+    async def test_update_task(self, task_service: TaskService, sample_task: Task):
         """
         Test task update.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
         update_data = TaskUpdate(
             title="Updated Title",
             description="Updated Description",
@@ -194,16 +194,14 @@ class TestTaskService:
         assert updated_task.status == "in_progress"
         assert updated_task.priority == 1
     
-    @pytest.mark.asyncio
-    async def test_update_task_partial(self, db_session: AsyncSession, sample_task: Task):
+    async def test_update_task_partial(self, task_service: TaskService, sample_task: Task):
         """
         Test partial task update.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
         original_description = sample_task.description
         update_data = TaskUpdate(title="New Title Only")
         
@@ -213,31 +211,27 @@ class TestTaskService:
         assert updated_task.title == "New Title Only"
         assert updated_task.description == original_description  # Unchanged
     
-    @pytest.mark.asyncio
-    async def test_update_task_not_found(self, db_session: AsyncSession):
+    async def test_update_task_not_found(self, task_service: TaskService):
         """
         Test updating a non-existent task.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
         """
-        task_service = TaskService(db_session)
         update_data = TaskUpdate(title="New Title")
         
         updated_task = await task_service.update_task(99999, update_data)
         
         assert updated_task is None
     
-    @pytest.mark.asyncio
-    async def test_delete_task(self, db_session: AsyncSession, sample_task: Task):
+    async def test_delete_task(self, task_service: TaskService, sample_task: Task):
         """
         Test task deletion.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
         task_id = sample_task.id
         
         deleted = await task_service.delete_task(task_id)
@@ -248,83 +242,80 @@ class TestTaskService:
         retrieved_task = await task_service.get_task_by_id(task_id)
         assert retrieved_task is None
     
-    @pytest.mark.asyncio
-    async def test_delete_task_not_found(self, db_session: AsyncSession):
+    async def test_delete_task_not_found(self, task_service: TaskService):
         """
         Test deleting a non-existent task.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
         """
-        task_service = TaskService(db_session)
-        
         deleted = await task_service.delete_task(99999)
         
         assert deleted is False
     
-    @pytest.mark.asyncio
-    async def test_delete_processing_task(self, db_session: AsyncSession, sample_task: Task):
+    async def test_delete_processing_task(self, db_session: AsyncSession, task_service: TaskService, sample_task: Task):
         """
         Test deleting a task that is being processed.
         
         Args:
             db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
-        
-        # Set task to processing
-        sample_task.status = TaskStatus.IN_PROGRESS.value
+        # Set task to processing with a direct UPDATE — no identity-map
+        # dirty tracking or full ORM flush for a one-column setup change
+        await db_session.execute(
+            update(Task)
+            .where(Task.id == sample_task.id)
+            .values(status=TaskStatus.IN_PROGRESS.value)
+        )
         await db_session.commit()
         
         with pytest.raises(ValueError, match="Cannot delete a task that is currently being processed"):
             await task_service.delete_task(sample_task.id)
     
-    @pytest.mark.asyncio
-    async def test_start_task_processing(self, db_session: AsyncSession, sample_task: Task):
+    async def test_start_task_processing(self, task_service: TaskService, sample_task: Task):
         """
         Test starting task processing.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
-        
         task = await task_service.start_task_processing(sample_task.id)
         
         assert task is not None
         assert task.status == TaskStatus.IN_PROGRESS.value
     
-    @pytest.mark.asyncio
-    async def test_start_task_processing_invalid_status(self, db_session: AsyncSession, sample_task: Task):
+    async def test_start_task_processing_invalid_status(self, db_session: AsyncSession, task_service: TaskService, sample_task: Task):
         """
         Test starting processing for a task with invalid status.
         
         Args:
             db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
-        
-        # Set task to completed
-        sample_task.status = TaskStatus.COMPLETED.value
+        # Set task to completed with a direct UPDATE (see
+        # test_delete_processing_task)
+        await db_session.execute(
+            update(Task)
+            .where(Task.id == sample_task.id)
+            .values(status=TaskStatus.COMPLETED.value)
+        )
         await db_session.commit()
         
         with pytest.raises(ValueError, match="cannot be processed"):
             await task_service.start_task_processing(sample_task.id)
     
-    @pytest.mark.asyncio
-    async def test_complete_task_processing_success(self, db_session: AsyncSession, sample_task: Task):
+    async def test_complete_task_processing_success(self, task_service: TaskService, sample_task: Task):
         """
         Test completing task processing successfully.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
-        
         task = await task_service.complete_task_processing(
             sample_task.id, 
             success=True, 
@@ -334,17 +325,14 @@ class TestTaskService:
         assert task is not None
         assert task.status == TaskStatus.COMPLETED.value
     
-    @pytest.mark.asyncio
-    async def test_complete_task_processing_failure(self, db_session: AsyncSession, sample_task: Task):
+    async def test_complete_task_processing_failure(self, task_service: TaskService, sample_task: Task):
         """
         Test completing task processing with failure.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_task: Sample task fixture
         """
-        task_service = TaskService(db_session)
-        
         task = await task_service.complete_task_processing(
             sample_task.id, 
             success=False, 
@@ -354,17 +342,14 @@ class TestTaskService:
         assert task is not None
         assert task.status == TaskStatus.FAILED.value
     
-    @pytest.mark.asyncio
-    async def test_get_task_statistics(self, db_session: AsyncSession, sample_tasks: list[Task]):
+    async def test_get_task_statistics(self, task_service: TaskService, sample_tasks: list[Task]):
         """
         Test getting task statistics.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_tasks: Sample tasks fixture
         """
-        task_service = TaskService(db_session)
-        
         stats = await task_service.get_task_statistics()
         
         assert stats["total_tasks"] == 4
@@ -375,17 +360,31 @@ class TestTaskService:
         assert stats["by_status"]["completed"] == 1
         assert stats["by_status"]["failed"] == 1
     
-    @pytest.mark.asyncio
-    async def test_get_tasks_for_processing(self, db_session: AsyncSession, sample_tasks: list[Task]):
+    async def test_get_task_statistics_invalidated_on_change(self, task_service: TaskService, sample_tasks: list[Task]):
+        """
+        Test that cached statistics are refreshed after task mutations.
+
+        Args:
+            task_service: Task service fixture
+            sample_tasks: Sample tasks fixture
+        """
+        stats = await task_service.get_task_statistics()
+        assert stats["total_tasks"] == 4
+
+        # A mutation through the service must invalidate the cached value
+        await task_service.create_task(TaskCreate(title="One more task"))
+
+        stats = await task_service.get_task_statistics()
+        assert stats["total_tasks"] == 5
+
+    async def test_get_tasks_for_processing(self, task_service: TaskService, sample_tasks: list[Task]):
         """
         Test getting tasks ready for processing.
         
         Args:
-            db_session: Test database session
+            task_service: Task service fixture
             sample_tasks: Sample tasks fixture
         """
-        task_service = TaskService(db_session)
-        
         tasks = await task_service.get_tasks_for_processing(limit=10)
         
         # Should return pending and failed tasks only